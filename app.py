@@ -1,6 +1,24 @@
+import re
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from core import (
+    load_data, load_title_index, filter_products,
+    sentiment_breakdown, sentiment_chart_table, SENTIMENT_BAR_SPEC
+)
+
+PAGE_SIZE = 20   # max product cards rendered per page
+
+# Chatbot keyword -> domain; one compiled scan instead of an if/elif chain
+KEYWORD_DOMAINS = {
+    "phone": "Electronics",
+    "mobile": "Electronics",
+    "book": "Books",
+    "cloth": "Clothing",
+    "shirt": "Clothing",
+    "dress": "Clothing"
+}
+DOMAIN_RE = re.compile("(" + "|".join(KEYWORD_DOMAINS) + ")")
 
 # --------------------------------------------------
 # STREAMLIT PAGE CONFIG
@@ -39,36 +57,22 @@ h1 {
 }
 
 .small { color: #6c757d; }
+
+.pill {
+    color: white;
+    text-align: center;
+    padding: 10px;
+    border-radius: 10px;
+    margin-bottom: 10px;
+}
 </style>
 """, unsafe_allow_html=True)
 
 # --------------------------------------------------
 # LOAD DATASET
 # --------------------------------------------------
-@st.cache_data
-def load_data():
-    return pd.read_csv("final_product_dataset.csv")   # <-- Your correct dataset name
-
-raw_df = load_data()
-
-# --------------------------------------------------
-# BUILD SENTIMENT LABELS
-# --------------------------------------------------
-raw_df["sentiment"] = raw_df["rating"].apply(
-    lambda r: "Positive" if r >= 4 else "Neutral" if r == 3 else "Negative"
-)
-
-sentiment_map = {"Positive": 1, "Neutral": 0, "Negative": -1}
-raw_df["sentiment_score"] = raw_df["sentiment"].map(sentiment_map)
-
-# --------------------------------------------------
-# AGGREGATE TO PRODUCT LEVEL
-# --------------------------------------------------
-product_df = raw_df.groupby(["product_title", "domain"]).agg(
-    avg_rating=("rating", "mean"),
-    review_count=("rating", "count"),
-    avg_sentiment_score=("sentiment_score", "mean")
-).reset_index()
+product_df, sent_counts, top_by_domain = load_data()
+title_index = load_title_index()
 
 # --------------------------------------------------
 # TOP HEADER
@@ -80,21 +84,19 @@ st.markdown("---")
 # --------------------------------------------------
 # SEARCH + CATEGORY FILTER
 # --------------------------------------------------
-c1, c2 = st.columns([3, 1])
+# Inputs live in a form so results only rerun on submit, not per keystroke
+with st.form("search"):
+    c1, c2 = st.columns([3, 1])
 
-with c1:
-    query = st.text_input("🔍 Search product", placeholder="Search phones, books, shirts...")
+    with c1:
+        query = st.text_input("🔍 Search product", placeholder="Search phones, books, shirts...")
 
-with c2:
-    domain_filter = st.selectbox("Category", ["All", "Books", "Electronics", "Clothing"])
+    with c2:
+        domain_filter = st.selectbox("Category", ["All", "Books", "Electronics", "Clothing"])
 
-filtered = product_df.copy()
+    st.form_submit_button("Search")
 
-if domain_filter != "All":
-    filtered = filtered[filtered["domain"] == domain_filter]
-
-if query:
-    filtered = filtered[filtered["product_title"].str.contains(query, case=False, na=False)]
+filtered = filter_products(product_df, domain_filter, query, title_index)
 
 # --------------------------------------------------
 # RESULTS AREA
@@ -104,18 +106,28 @@ st.subheader("🔎 Search Results")
 if filtered.empty:
     st.warning("No matching products found.")
 else:
-    for _, row in filtered.iterrows():
+    # Only render one page of cards, best rated first
+    n_pages = (len(filtered) - 1) // PAGE_SIZE + 1
+    page = st.number_input(
+        "Page", min_value=1, max_value=n_pages, value=1, step=1,
+        key=f"page_{domain_filter}_{query}"   # new search -> back to page 1
+    )
+    start = (page - 1) * PAGE_SIZE
+    view = filtered.nlargest(page * PAGE_SIZE, "avg_rating").iloc[start:]
+    st.caption(f"Showing {start + 1}–{start + len(view)} of {len(filtered)} products")
+
+    for row in view.itertuples(index=False):
 
         st.markdown("<div class='card'>", unsafe_allow_html=True)
 
         # Title + Rating Block
         tcol, rcol = st.columns([4, 1])
         with tcol:
-            st.markdown(f"### {row['product_title']}")
+            st.markdown(f"### {row.product_title}")
         with rcol:
-            st.metric("⭐ Rating", round(row["avg_rating"], 2))
+            st.metric("⭐ Rating", round(row.avg_rating, 2))
 
-        st.caption(f"Total Reviews: {row['review_count']}")
+        st.caption(f"Total Reviews: {row.review_count}")
 
         # Summary placeholder
         st.markdown("<div class='section'>📘 Review Summary</div>", unsafe_allow_html=True)
@@ -123,14 +135,14 @@ else:
 
         # Sentiment Meter
         st.markdown("<div class='section'>🎛 Sentiment Meter</div>", unsafe_allow_html=True)
-        meter_val = (row["avg_sentiment_score"] + 1) / 2
+        meter_val = (row.avg_sentiment_score + 1) / 2
         st.progress(meter_val)
 
         # Buying Guide Logic
         st.markdown("<div class='section'>🎯 Buying Recommendation</div>", unsafe_allow_html=True)
-        if row["avg_rating"] >= 4:
+        if row.avg_rating >= 4:
             st.success("Must Buy")
-        elif row["avg_rating"] < 3:
+        elif row.avg_rating < 3:
             st.error("Avoid")
         else:
             st.warning("Think Again")
@@ -138,47 +150,30 @@ else:
         # -------------------------------
         # SENTIMENT PIE & BAR CHARTS
         # -------------------------------
-        product_reviews = raw_df[raw_df["product_title"] == row["product_title"]]
-
-        pos = (product_reviews["sentiment"] == "Positive").sum()
-        neu = (product_reviews["sentiment"] == "Neutral").sum()
-        neg = (product_reviews["sentiment"] == "Negative").sum()
-
-        sentiment_df = pd.DataFrame({
-            "Sentiment": ["Positive", "Neutral", "Negative"],
-            "Count": [pos, neu, neg]
-        })
+        pos, neu, neg = sent_counts.loc[row.product_title, ["Positive", "Neutral", "Negative"]]
 
         st.markdown("<div class='section'>📊 Sentiment Breakdown</div>", unsafe_allow_html=True)
 
-        # PIE
-        fig_pie = px.pie(
-            sentiment_df,
-            values="Count",
-            names="Sentiment",
-            color="Sentiment",
-            color_discrete_map={
-                "Positive": "#4CAF50",
-                "Neutral": "#FFC107",
-                "Negative": "#F44336"
-            }
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
-
-        # BAR
-        fig_bar = px.bar(
-            sentiment_df,
-            x="Sentiment",
-            y="Count",
-            text="Count",
-            color="Sentiment",
-            color_discrete_map={
-                "Positive": "#4CAF50",
-                "Neutral": "#FFC107",
-                "Negative": "#F44336"
-            }
-        )
-        st.plotly_chart(fig_bar, use_container_width=True)
+        if pos + neu + neg == 0:
+            st.info("No reviews to chart yet.")
+        else:
+            breakdown = sentiment_breakdown(pos, neu, neg)
+
+            # SHARE PILLS (lightweight stand-in for a pie chart)
+            pills = zip(st.columns(3), breakdown["Sentiment"], breakdown["Share"], breakdown["Color"])
+            for col, label, share, color in pills:
+                col.markdown(
+                    f"<div class='pill' style='background:{color};'>"
+                    f"{label}<br><b>{share:.0f}%</b></div>",
+                    unsafe_allow_html=True
+                )
+
+            # BAR
+            st.vega_lite_chart(
+                sentiment_chart_table(breakdown),
+                SENTIMENT_BAR_SPEC,
+                key=f"bar_{row.product_title}"
+            )
 
         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -194,20 +189,14 @@ user_q = st.text_input(
 if user_q:
     q = user_q.lower()
 
-    if "phone" in q or "mobile" in q:
-        subset = product_df[product_df["domain"] == "Electronics"]
-    elif "book" in q:
-        subset = product_df[product_df["domain"] == "Books"]
-    elif "cloth" in q or "shirt" in q or "dress" in q:
-        subset = product_df[product_df["domain"] == "Clothing"]
-    else:
-        subset = product_df
+    m = DOMAIN_RE.search(q)
+    domain = KEYWORD_DOMAINS[m.group(1)] if m else "All"
 
-    best = subset.sort_values("avg_rating", ascending=False).iloc[0]
+    best = top_by_domain[domain]
 
     st.success(
         f"### ✅ Recommended Product\n\n"
         f"**{best['product_title']}**\n"
-        f"- ⭐ Rating: {round(best['avg_rating'], 2)}\n"
+        f"- ⭐ Rating: {round(float(best['avg_rating']), 2)}\n"
         f"- 🛒 Category: {best['domain']}"
     )
@@ -0,0 +1,212 @@
+from bisect import bisect_left, bisect_right
+
+import streamlit as st
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+# Shared data + chart helpers for the dashboard (app.py)
+
+SENTIMENT_LEVELS = ["Negative", "Neutral", "Positive"]
+
+# --------------------------------------------------
+# LOAD DATASET
+# --------------------------------------------------
+@st.cache_data(show_spinner=False)
+def load_data():
+    # Parquet is built from final_product_dataset.csv by csv_to_parquet.py
+    # Heavy lifting runs in Polars; only the results cross into pandas.
+    lf = pl.scan_parquet("final_product_dataset.parquet").select(
+        pl.col("product_title"),
+        pl.col("domain").cast(pl.Categorical),
+        # Ratings are 1..5, float32 is plenty and halves the column width
+        pl.col("rating").cast(pl.Float32),
+    )
+
+    # --------------------------------------------------
+    # BUILD SENTIMENT SCORES (vectorized, runs once)
+    # --------------------------------------------------
+    rating = pl.col("rating")
+    score = (
+        pl.when(rating >= 4).then(1)
+        .when(rating == 3).then(0)
+        .otherwise(-1)
+        .cast(pl.Int8)
+    )
+    reviews = lf.with_columns(score.alias("sentiment_score"))
+
+    # --------------------------------------------------
+    # AGGREGATE TO PRODUCT LEVEL + SENTIMENT COUNTS
+    # One grouping pass (products are factorized once) feeds both tables.
+    # --------------------------------------------------
+    rollup = reviews.group_by(["product_title", "domain"]).agg(
+        pl.col("rating").mean().cast(pl.Float32).alias("avg_rating"),
+        pl.col("rating").count().cast(pl.Int32).alias("review_count"),
+        pl.col("sentiment_score").mean().cast(pl.Float32).alias("avg_sentiment_score"),
+        (pl.col("sentiment_score") == 1).sum().alias("Positive"),
+        (pl.col("sentiment_score") == 0).sum().alias("Neutral"),
+        (pl.col("sentiment_score") == -1).sum().alias("Negative"),
+    ).sort("product_title").collect()
+
+    # --------------------------------------------------
+    # HAND OFF TO PANDAS FOR THE UI
+    # --------------------------------------------------
+    product_df = rollup.drop(SENTIMENT_LEVELS).to_pandas()
+    sent_counts = rollup.select("product_title", *SENTIMENT_LEVELS).to_pandas().set_index("product_title")
+
+    # Arrow-backed strings let .str.contains use Arrow's substring kernel
+    product_df["product_title"] = product_df["product_title"].astype("string[pyarrow]")
+    # Case-folded once here so searches don't re-fold every keystroke
+    product_df["title_lc"] = product_df["product_title"].str.casefold()
+
+    # --------------------------------------------------
+    # TOP PRODUCT PER DOMAIN (answers for the chatbot)
+    # --------------------------------------------------
+    top_by_domain = {
+        domain: group.nlargest(1, "avg_rating").iloc[0]
+        for domain, group in product_df.groupby("domain", observed=True)
+    }
+    top_by_domain["All"] = product_df.nlargest(1, "avg_rating").iloc[0]
+
+    return product_df, sent_counts, top_by_domain
+
+
+# --------------------------------------------------
+# TITLE SEARCH INDEX (sorted suffixes of every title)
+# A substring of a title is a prefix of one of its suffixes, so a
+# search is two bisects plus the matching range instead of a full scan.
+# Suffixes are kept as (row, offset) int pairs and only sliced out
+# while comparing. The sort works on int ranks, so neither the build
+# nor the stored index holds suffix strings; both are linear in the
+# total title length.
+# --------------------------------------------------
+def sort_suffixes(titles):
+    # Prefix doubling: after each round, rank orders suffixes by their
+    # first 2k characters. A suffix running off the end of its title
+    # reads as -1, so shorter suffixes sort first like Python strings.
+    lengths = np.array([len(t) for t in titles], dtype=np.int32)
+    rows = np.repeat(np.arange(len(titles), dtype=np.int32), lengths)
+    ends = np.repeat(np.cumsum(lengths, dtype=np.int32), lengths)
+    starts = ends - lengths[rows]
+    # Code points straight from a UTF-32 buffer (no per-character objects)
+    chars = "".join(titles).encode("utf-32-le")
+    rank = np.frombuffer(chars, dtype=np.uint32).astype(np.int32)
+    pos = np.arange(len(rank), dtype=np.int32)
+
+    k = 1
+    while True:
+        nxt = np.full(len(rank), -1, dtype=np.int32)
+        inside = np.flatnonzero(pos + k < ends)
+        nxt[inside] = rank[inside + k]
+        order = np.lexsort((nxt, rank))
+
+        r, n = rank[order], nxt[order]
+        new_group = np.r_[True, (r[1:] != r[:-1]) | (n[1:] != n[:-1])]
+        rank = np.empty_like(rank)
+        rank[order] = np.cumsum(new_group, dtype=np.int32) - 1
+
+        # Done once every suffix is distinct or k covers the longest title
+        if new_group.all() or k >= lengths.max(initial=0):
+            break
+        k *= 2
+
+    return rows[order], (pos - starts)[order]
+
+
+@st.cache_resource(show_spinner=False)
+def load_title_index():
+    product_df, _, _ = load_data()
+    titles = list(product_df["title_lc"])
+    rows, offsets = sort_suffixes(titles)
+    return titles, rows, offsets, product_df.index.to_numpy()
+
+
+def search_titles(title_index, query):
+    titles, rows, offsets, labels = title_index
+
+    def suffix(k):
+        return titles[rows[k]][offsets[k]:]
+
+    q = query.casefold()
+    lo = bisect_left(range(len(rows)), q, key=suffix)
+    hi = bisect_right(range(len(rows)), q + chr(0x10FFFF), key=suffix)
+    # Index labels, not positions, so subsets/reorders of product_df still match
+    return np.unique(labels[rows[lo:hi]])
+
+
+# --------------------------------------------------
+# SEARCH + CATEGORY FILTER
+# --------------------------------------------------
+def filter_products(product_df, domain, query, title_index=None):
+    filtered = product_df
+
+    if query:
+        if title_index is not None:
+            # Look the matches up by label: cost follows the hits, not the table
+            hits = filtered.index.get_indexer(search_titles(title_index, query))
+            filtered = filtered.take(np.sort(hits[hits >= 0]))
+        else:
+            filtered = filtered[filtered["title_lc"].str.contains(query.casefold(), na=False, regex=False)]
+
+    if domain != "All":
+        filtered = filtered[filtered["domain"] == domain]
+
+    return filtered
+
+
+# --------------------------------------------------
+# SENTIMENT BREAKDOWN (feeds share pills + bar chart)
+# --------------------------------------------------
+SENTIMENT_COLORS = {
+    "Positive": "#4CAF50",
+    "Neutral": "#FFC107",
+    "Negative": "#F44336"
+}
+
+# Explicit domain/range keeps each label on its own color (Vega-Lite
+# would otherwise pair a sorted domain with the range), and the x sort
+# keeps bars in the same Positive/Neutral/Negative order as the pills.
+SENTIMENT_BAR_SPEC = {
+    "encoding": {
+        "x": {
+            "field": "Sentiment",
+            "type": "nominal",
+            "sort": list(SENTIMENT_COLORS),
+            "axis": {"labelAngle": 0}
+        },
+        "y": {"field": "Count", "type": "quantitative"},
+        "color": {
+            "field": "Sentiment",
+            "type": "nominal",
+            "scale": {
+                "domain": list(SENTIMENT_COLORS),
+                "range": list(SENTIMENT_COLORS.values())
+            },
+            "legend": None
+        }
+    },
+    "layer": [
+        {"mark": "bar"},
+        {
+            "mark": {"type": "text", "dy": -8},
+            "encoding": {"text": {"field": "Count", "type": "quantitative"}}
+        }
+    ]
+}
+
+def sentiment_breakdown(pos, neu, neg):
+    # Plain lists for the pills; the bar chart reads sentiment_chart_table
+    counts = [int(pos), int(neu), int(neg)]
+    total = sum(counts)
+    return {
+        "Sentiment": list(SENTIMENT_COLORS),
+        "Count": counts,
+        "Share": [100 * c / total for c in counts],
+        "Color": list(SENTIMENT_COLORS.values())
+    }
+
+
+def sentiment_chart_table(breakdown):
+    # A pyarrow Table is serialized straight to Arrow by st.vega_lite_chart;
+    # dicts/lists would be converted to a pandas DataFrame first.
+    return pa.table({"Sentiment": breakdown["Sentiment"], "Count": breakdown["Count"]})
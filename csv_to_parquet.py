@@ -0,0 +1,13 @@
+import pandas as pd
+
+# --------------------------------------------------
+# ONE-TIME CONVERSION: CSV -> PARQUET
+# Re-run whenever final_product_dataset.csv changes.
+# --------------------------------------------------
+SRC = "final_product_dataset.csv"
+DST = "final_product_dataset.parquet"
+
+df = pd.read_csv(SRC)
+df.to_parquet(DST, engine="pyarrow", compression="zstd", index=False)
+
+print(f"Wrote {len(df)} rows to {DST}")